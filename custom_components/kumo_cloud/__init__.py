@@ -2,24 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import entity_registry as er
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
 from .api import KumoCloudAPI, KumoCloudAuthError, KumoCloudConnectionError
-from .const import CONF_SITE_ID, DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import CONF_SITE_ID, DOMAIN, DEFAULT_SCAN_INTERVAL, TOKEN_EXPIRY_MARGIN
 from .coordinator import KumoCloudDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR]
 
+# Orphaned entities removed per batch before yielding to the event loop
+CLEANUP_BATCH_SIZE = 100
+
+# Service schemas are built once per process rather than on every entry setup
+REFRESH_DEVICE_SCHEMA = vol.Schema({
+    vol.Required("entity_id"): cv.entity_id,
+})
+
+CLEAR_CACHE_SCHEMA = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_id,
+})
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Kumo Cloud component (Optimization 28: Config Flow only)."""
@@ -33,10 +48,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     api = KumoCloudAPI(hass, entry)
 
     # Initialize with stored tokens if available
+    stored_expiry = entry.data.get("token_expires_at")
     if "access_token" in entry.data:
         api.username = entry.data[CONF_USERNAME]
         api.access_token = entry.data["access_token"]
         api.refresh_token = entry.data["refresh_token"]
+        if stored_expiry is not None:
+            api.restore_token_expiry(stored_expiry)
 
     try:
         # Optimization 20: Handle missing password (no longer stored for security)
@@ -49,8 +67,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             else:
                 # New entry without password - trigger reauth
                 raise ConfigEntryAuthFailed("Re-authentication required")
-        else:
-            # Verify the token works by making a test request
+        elif stored_expiry is None or stored_expiry - time.time() <= TOKEN_EXPIRY_MARGIN:
+            # Expiry unknown or close: verify the token works by making a test request.
+            # Otherwise skip the round-trip; the coordinator's first refresh will
+            # surface a rejected token through its own refresh path.
             try:
                 await api.get_account_info()
             except KumoCloudAuthError:
@@ -64,22 +84,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady(f"Unable to connect: {err}") from err
 
     # Remove any legacy password storage and persist fresh tokens after login.
-    updated_data = dict(entry.data)
-    needs_entry_update = False
-
-    if CONF_PASSWORD in updated_data:
-        updated_data.pop(CONF_PASSWORD, None)
-        needs_entry_update = True
+    # login() already persists (and drops the password), so this normally finds
+    # nothing to write; only copy entry.data when something actually changed.
+    changes: dict[str, Any] = {}
 
-    if api.access_token and updated_data.get("access_token") != api.access_token:
-        updated_data["access_token"] = api.access_token
-        needs_entry_update = True
+    if api.access_token and entry.data.get("access_token") != api.access_token:
+        changes["access_token"] = api.access_token
 
-    if api.refresh_token and updated_data.get("refresh_token") != api.refresh_token:
-        updated_data["refresh_token"] = api.refresh_token
-        needs_entry_update = True
+    if api.refresh_token and entry.data.get("refresh_token") != api.refresh_token:
+        changes["refresh_token"] = api.refresh_token
 
-    if needs_entry_update:
+    if changes or CONF_PASSWORD in entry.data:
+        updated_data = {**entry.data, **changes}
+        updated_data.pop(CONF_PASSWORD, None)
         hass.config_entries.async_update_entry(entry, data=updated_data)
 
     # Create the coordinator (Optimization 22: Use options for scan_interval)
@@ -118,6 +135,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         # Optimization 34: Clean up coordinator resources
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # Don't let token refreshes or profile fetches outlive the entry
+        coordinator.api.cancel_pending_tasks()
         if hasattr(coordinator, "async_shutdown"):
             await coordinator.async_shutdown()
 
@@ -134,21 +153,28 @@ async def _async_cleanup_entities(
     entity_reg = er.async_get(hass)
 
     # Get current device serials
-    current_devices = {
-        zone["adapter"]["deviceSerial"]
-        for zone in coordinator.zones
-        if "adapter" in zone and zone["adapter"]
-    }
+    current_devices = coordinator.zones_by_serial.keys()
+
+    entries = er.async_entries_for_config_entry(entity_reg, entry.entry_id)
+    if not current_devices and not entries:
+        return
 
-    # Find and remove orphaned entities
-    for entity in er.async_entries_for_config_entry(entity_reg, entry.entry_id):
-        # Extract device serial from unique_id (format varies by entity type)
-        parts = entity.unique_id.split("_")
-        if len(parts) >= 1:
-            device_serial = parts[0]
-            if device_serial not in current_devices:
-                entity_reg.async_remove(entity.entity_id)
-                _LOGGER.info("Removed orphaned entity: %s", entity.entity_id)
+    # Collect orphaned entities first so the registry isn't mutated mid-iteration.
+    # The device serial is the unique_id prefix (format varies by entity type).
+    to_remove = [
+        entity.entity_id
+        for entity in entries
+        if entity.unique_id.partition("_")[0] not in current_devices
+    ]
+
+    async_remove = entity_reg.async_remove
+    for start in range(0, len(to_remove), CLEANUP_BATCH_SIZE):
+        if start:
+            # Yield between batches so large registries don't stall the loop
+            await asyncio.sleep(0)
+        for entity_id in to_remove[start:start + CLEANUP_BATCH_SIZE]:
+            async_remove(entity_id)
+            _LOGGER.info("Removed orphaned entity: %s", entity_id)
 
 
 
@@ -159,28 +185,53 @@ async def _async_register_services(hass: HomeAssistant) -> None:
     if hass.services.has_service(DOMAIN, "refresh_device"):
         return
 
+    # entity_id -> (config_entry_id, device_serial), dropped on any registry change
+    lookup_cache: dict[str, tuple[str, str]] = {}
+
+    @callback
+    def _async_clear_lookup_cache(_event: Event) -> None:
+        """Invalidate cached entity lookups when the entity registry changes."""
+        lookup_cache.clear()
+
+    hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _async_clear_lookup_cache)
+
+    @callback
+    def _async_resolve_entity(entity_id: str) -> tuple[str, str] | None:
+        """Return the config entry ID and device serial for an entity."""
+        if (resolved := lookup_cache.get(entity_id)) is not None:
+            return resolved
+
+        entity_entry = er.async_get(hass).async_get(entity_id)
+        if not entity_entry:
+            return None
+
+        # Device serial is the unique_id prefix
+        resolved = (entity_entry.config_entry_id, entity_entry.unique_id.partition("_")[0])
+        lookup_cache[entity_id] = resolved
+        return resolved
+
     async def async_refresh_device_service(call: ServiceCall) -> None:
         """Handle refresh_device service call."""
         entity_id = call.data.get("entity_id")
         if not entity_id:
             return
         
-        # Find the device serial from entity
-        entity_reg = er.async_get(hass)
-        entity_entry = entity_reg.async_get(entity_id)
-        
-        if not entity_entry:
+        # Find the config entry and device serial from entity
+        resolved = _async_resolve_entity(entity_id)
+        if not resolved:
             _LOGGER.error("Entity %s not found", entity_id)
             return
+        config_entry_id, device_serial = resolved
         
         # Get coordinator from entry
-        coordinator = hass.data[DOMAIN].get(entity_entry.config_entry_id)
+        coordinator = hass.data[DOMAIN].get(config_entry_id)
         if not coordinator:
             _LOGGER.error("Coordinator not found for entity %s", entity_id)
             return
         
-        # Extract device serial from unique_id
-        device_serial = entity_entry.unique_id.split("_")[0]
+        if device_serial not in coordinator.zones_by_serial:
+            _LOGGER.error("Device %s not found for entity %s", device_serial, entity_id)
+            return
         
         _LOGGER.info("Forcing refresh for device %s", device_serial)
         await coordinator.async_refresh_device(device_serial)
@@ -191,45 +242,34 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         
         if entity_id:
             # Clear cache for specific device
-            entity_reg = er.async_get(hass)
-            entity_entry = entity_reg.async_get(entity_id)
-            
-            if not entity_entry:
+            resolved = _async_resolve_entity(entity_id)
+            if not resolved:
                 _LOGGER.error("Entity %s not found", entity_id)
                 return
+            config_entry_id, device_serial = resolved
             
-            coordinator = hass.data[DOMAIN].get(entity_entry.config_entry_id)
+            coordinator = hass.data[DOMAIN].get(config_entry_id)
             if coordinator:
-                device_serial = entity_entry.unique_id.split("_")[0]
-                # Remove cached commands for this device
-                keys_to_remove = [
-                    key for key in coordinator.cached_commands.keys()
-                    if key[0] == device_serial
-                ]
-                for key in keys_to_remove:
-                    del coordinator.cached_commands[key]
-                _LOGGER.info("Cleared %d cached commands for device %s", len(keys_to_remove), device_serial)
+                count = coordinator.clear_cached_commands(device_serial)
+                coordinator.api.clear_profile_cache(device_serial)
+                _LOGGER.info("Cleared %d cached commands for device %s", count, device_serial)
         else:
             # Clear all caches
             for coordinator in hass.data[DOMAIN].values():
-                count = len(coordinator.cached_commands)
-                coordinator.cached_commands.clear()
+                count = coordinator.clear_cached_commands()
+                coordinator.api.clear_profile_cache()
                 _LOGGER.info("Cleared %d cached commands", count)
 
     hass.services.async_register(
         DOMAIN,
         "refresh_device",
         async_refresh_device_service,
-        schema=vol.Schema({
-            vol.Required("entity_id"): cv.entity_id,
-        }),
+        schema=REFRESH_DEVICE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         "clear_cache",
         async_clear_cache_service,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-        }),
+        schema=CLEAR_CACHE_SCHEMA,
     )
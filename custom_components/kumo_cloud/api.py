@@ -5,13 +5,17 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import aiohttp
 from aiohttp import ClientResponseError, ClientTimeout
+import orjson
 
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
@@ -21,6 +25,8 @@ from .const import (
     API_APP_VERSION,
     TOKEN_REFRESH_INTERVAL,
     TOKEN_EXPIRY_MARGIN,
+    RETRY_AFTER_MIN,
+    RETRY_AFTER_MAX,
 )
 # Optimization 7: Import type definitions for better type safety
 from .types import (
@@ -33,49 +39,88 @@ from .types import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# aiohttp-native timeouts, passed per request (the shared HA session has no default)
+_REQUEST_TIMEOUT = ClientTimeout(total=30, sock_connect=10, sock_read=20)
+
+# Static endpoint paths, appended to the precomputed API root
+_LOGIN = "/login"
+_REFRESH = "/refresh"
+_ACCOUNTS_ME = "/accounts/me"
+_SITES = "/sites/"
+_SEND_COMMAND = "/devices/send-command"
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into a clamped delay."""
+    if not value:
+        return None
+
+    try:
+        delay = float(int(value))
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(delay, RETRY_AFTER_MIN), RETRY_AFTER_MAX)
+
 
 # Optimization 8: Rate limiting as async context manager
-class RateLimiter:
-    """Async context manager for rate limiting API requests."""
+class TokenBucket:
+    """Async context manager pacing API requests (capacity 1) without a lock."""
 
-    def __init__(self, min_interval: timedelta, lock: asyncio.Lock) -> None:
-        """Initialize rate limiter.
+    __slots__ = ("min_interval", "min_interval_s", "next_allowed", "hold_until")
+
+    def __init__(self, min_interval: timedelta) -> None:
+        """Initialize the token bucket.
 
         Args:
-            min_interval: Minimum time between requests
-            lock: Shared lock for synchronization
+            min_interval: Minimum time between request starts
         """
         self.min_interval = min_interval
-        self.lock = lock
-        self.last_request_time: datetime | None = None
-
-    async def __aenter__(self) -> RateLimiter:
-        """Enter the context manager and enforce rate limiting."""
-        await self.lock.acquire()
-
-        if self.last_request_time is not None:
-            time_since_last = datetime.now() - self.last_request_time
-            if time_since_last < self.min_interval:
-                wait_time = (self.min_interval - time_since_last).total_seconds()
-                if wait_time > 0:
-                    _LOGGER.debug(
-                        "Rate limiting: waiting %.1f seconds before next request",
-                        wait_time,
-                    )
-                    try:
-                        await asyncio.sleep(wait_time)
-                    except asyncio.CancelledError:
-                        self.lock.release()
-                        raise
-
-        return self
+        self.min_interval_s = min_interval.total_seconds()
+        # Monotonic event loop time at which the next request may start
+        self.next_allowed = 0.0
+        # No request may start before this time (set by a server-requested backoff)
+        self.hold_until = 0.0
+
+    async def __aenter__(self) -> TokenBucket:
+        """Enter the context manager and wait for this request's slot."""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            start = max(now, self.next_allowed, self.hold_until)
+            # Reserve the slot before sleeping so concurrent callers queue behind it;
+            # this is safe without a lock on the single-threaded event loop
+            self.next_allowed = start + self.min_interval_s
+
+            wait_time = start - now
+            if wait_time <= 0:
+                return self
+
+            _LOGGER.debug(
+                "Rate limiting: waiting %.1f seconds before next request",
+                wait_time,
+            )
+            await asyncio.sleep(wait_time)
+
+            # A backoff that began while we slept also applies to slots that
+            # were already reserved: queue up again behind it
+            if self.hold_until <= start:
+                return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit the context manager and update timestamp."""
-        if exc_type is None:
-            # Only update timestamp on successful request
-            self.last_request_time = datetime.now()
-        self.lock.release()
+        """Exit the context manager."""
+
+    def defer(self, delay: float) -> None:
+        """Hold back every request, including queued ones, for delay seconds."""
+        self.hold_until = max(
+            self.hold_until, asyncio.get_running_loop().time() + delay
+        )
 
 
 class KumoCloudError(HomeAssistantError):
@@ -93,6 +138,23 @@ class KumoCloudConnectionError(KumoCloudError):
 class KumoCloudAPI:
     """Kumo Cloud API client."""
 
+    __slots__ = (
+        "hass",
+        "session",
+        "base_url",
+        "_api_root",
+        "_base_headers",
+        "_auth_headers",
+        "username",
+        "_access_token",
+        "refresh_token",
+        "token_expires_at",
+        "_config_entry",
+        "_rate_limiter",
+        "_refresh_task",
+        "_profile_cache",
+    )
+
     def __init__(self, hass: HomeAssistant, config_entry=None) -> None:
         """Initialize the API client.
 
@@ -103,25 +165,44 @@ class KumoCloudAPI:
         self.hass = hass
         self.session = async_get_clientsession(hass)
         self.base_url = API_BASE_URL
+        self._api_root = f"{self.base_url}/{API_VERSION}"
+        # Static headers are built once; the auth copy is updated in place on token change
+        self._base_headers = {
+            "x-app-version": API_APP_VERSION,
+            "Content-Type": "application/json",
+        }
+        self._auth_headers = dict(self._base_headers)
         self.username: str | None = None
         self.access_token: str | None = None
         self.refresh_token: str | None = None
-        self.token_expires_at: datetime | None = None
+        # Monotonic event loop deadline for the current access token
+        self.token_expires_at: float | None = None
         self._config_entry = config_entry  # Optimization 6: Store for token updates
         # Optimization 8: Use rate limiter context manager
-        self._request_lock = asyncio.Lock()
-        self._rate_limiter = RateLimiter(
-            min_interval=timedelta(seconds=2),
-            lock=self._request_lock,
-        )
+        self._rate_limiter = TokenBucket(min_interval=timedelta(seconds=2))
+        # In-flight token refresh shared by all concurrent callers
+        self._refresh_task: asyncio.Task[None] | None = None
+        # Device profiles are static hardware capabilities, fetched once per device.
+        # The fetch task itself is memoised so concurrent callers share it.
+        self._profile_cache: dict[str, asyncio.Task[list[DeviceProfile]]] = {}
+
+    @property
+    def access_token(self) -> str | None:
+        """Return the current access token."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: str | None) -> None:
+        """Set the access token and keep the Authorization header in sync."""
+        self._access_token = value
+        if value:
+            self._auth_headers["Authorization"] = f"Bearer {value}"
+        else:
+            self._auth_headers.pop("Authorization", None)
 
     async def login(self, username: str, password: str) -> LoginResponse:
         """Login to Kumo Cloud and return user data."""
-        url = f"{self.base_url}/{API_VERSION}/login"
-        headers = {
-            "x-app-version": API_APP_VERSION,
-            "Content-Type": "application/json",
-        }
+        url = self._api_root + _LOGIN
         data = {
             "username": username,
             "password": password,
@@ -129,23 +210,16 @@ class KumoCloudAPI:
         }
 
         try:
-            async with asyncio.timeout(30):
-                async with self.session.post(
-                    url, headers=headers, json=data
-                ) as response:
-                    if response.status == 403:
-                        raise KumoCloudAuthError("Invalid username or password")
-                    response.raise_for_status()
-                    result = await response.json()
-
-                    self.username = username
-                    self.access_token = result["token"]["access"]
-                    self.refresh_token = result["token"]["refresh"]
-                    self.token_expires_at = datetime.now() + timedelta(
-                        seconds=TOKEN_REFRESH_INTERVAL
-                    )
-
-                    return result
+            async with self.session.post(
+                url,
+                headers=self._base_headers,
+                data=orjson.dumps(data),
+                timeout=_REQUEST_TIMEOUT,
+            ) as response:
+                if response.status == 403:
+                    raise KumoCloudAuthError("Invalid username or password")
+                response.raise_for_status()
+                result = orjson.loads(await response.read())
 
         except asyncio.TimeoutError as err:
             raise KumoCloudConnectionError("Connection timeout") from err
@@ -153,48 +227,42 @@ class KumoCloudAPI:
             if err.status == 403:
                 raise KumoCloudAuthError("Invalid credentials") from err
             raise KumoCloudConnectionError(f"HTTP error: {err.status}") from err
-        except Exception as err:
-            raise KumoCloudConnectionError(f"Unexpected error: {err}") from err
+        except (aiohttp.ClientError, json.JSONDecodeError) as err:
+            raise KumoCloudConnectionError(f"Connection error: {err}") from err
+
+        try:
+            access_token = result["token"]["access"]
+            refresh_token = result["token"]["refresh"]
+        except (KeyError, TypeError) as err:
+            raise KumoCloudAuthError("Malformed login response") from err
+
+        self.username = username
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.token_expires_at = asyncio.get_running_loop().time() + TOKEN_REFRESH_INTERVAL
+        self._persist_tokens()
+
+        return result
 
     async def refresh_access_token(self) -> None:
         """Refresh the access token."""
         if not self.refresh_token:
             raise KumoCloudAuthError("No refresh token available")
 
-        url = f"{self.base_url}/{API_VERSION}/refresh"
-        headers = {
-            "x-app-version": API_APP_VERSION,
-            "Content-Type": "application/json",
-        }
+        url = self._api_root + _REFRESH
         data = {"refresh": self.refresh_token}
 
         try:
-            async with asyncio.timeout(30):
-                async with self.session.post(
-                    url, headers=headers, json=data
-                ) as response:
-                    if response.status == 401:
-                        raise KumoCloudAuthError("Refresh token expired")
-                    response.raise_for_status()
-                    result = await response.json()
-
-                    self.access_token = result["access"]
-                    self.refresh_token = result["refresh"]
-                    self.token_expires_at = datetime.now() + timedelta(
-                        seconds=TOKEN_REFRESH_INTERVAL
-                    )
-
-                    # Optimization 6: Persist refreshed tokens to config entry
-                    if self._config_entry:
-                        self.hass.config_entries.async_update_entry(
-                            self._config_entry,
-                            data={
-                                **self._config_entry.data,
-                                "access_token": self.access_token,
-                                "refresh_token": self.refresh_token,
-                            },
-                        )
-                        _LOGGER.debug("Persisted refreshed tokens to config entry")
+            async with self.session.post(
+                url,
+                headers=self._base_headers,
+                data=orjson.dumps(data),
+                timeout=_REQUEST_TIMEOUT,
+            ) as response:
+                if response.status == 401:
+                    raise KumoCloudAuthError("Refresh token expired")
+                response.raise_for_status()
+                result = orjson.loads(await response.read())
 
         except asyncio.TimeoutError as err:
             raise KumoCloudConnectionError("Connection timeout during refresh") from err
@@ -204,6 +272,53 @@ class KumoCloudAPI:
             raise KumoCloudConnectionError(
                 f"HTTP error during refresh: {err.status}"
             ) from err
+        except (aiohttp.ClientError, json.JSONDecodeError) as err:
+            raise KumoCloudConnectionError(
+                f"Connection error during refresh: {err}"
+            ) from err
+
+        try:
+            access_token = result["access"]
+            refresh_token = result["refresh"]
+        except (KeyError, TypeError) as err:
+            raise KumoCloudAuthError("Malformed refresh response") from err
+
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.token_expires_at = asyncio.get_running_loop().time() + TOKEN_REFRESH_INTERVAL
+
+        self._persist_tokens()
+
+    def token_expiry_timestamp(self) -> float | None:
+        """Return the access token expiry as a wall-clock UNIX timestamp."""
+        if self.token_expires_at is None:
+            return None
+        return time.time() + (self.token_expires_at - asyncio.get_running_loop().time())
+
+    def restore_token_expiry(self, timestamp: float) -> None:
+        """Restore a persisted wall-clock token expiry onto the monotonic clock."""
+        self.token_expires_at = asyncio.get_running_loop().time() + (
+            timestamp - time.time()
+        )
+
+    def _persist_tokens(self) -> None:
+        """Persist the current tokens to the config entry (Optimization 6)."""
+        if not self._config_entry:
+            return
+
+        entry_data = self._config_entry.data
+        new_data = entry_data | {
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "token_expires_at": self.token_expiry_timestamp(),
+        }
+        # Optimization 20: never keep a legacy stored password alongside tokens
+        new_data.pop(CONF_PASSWORD, None)
+        if new_data == entry_data:
+            return
+
+        self.hass.config_entries.async_update_entry(self._config_entry, data=new_data)
+        _LOGGER.debug("Persisted refreshed tokens to config entry")
 
     async def _ensure_token_valid(self) -> None:
         """Ensure access token is valid, refresh if needed."""
@@ -211,118 +326,107 @@ class KumoCloudAPI:
             raise KumoCloudAuthError("No access token available")
 
         if (
-            self.token_expires_at
-            and datetime.now() + timedelta(seconds=TOKEN_EXPIRY_MARGIN)
+            self.token_expires_at is not None
+            and asyncio.get_running_loop().time() + TOKEN_EXPIRY_MARGIN
             >= self.token_expires_at
         ):
-            await self.refresh_access_token()
+            await self.async_refresh_tokens()
+
+    async def async_refresh_tokens(self) -> None:
+        """Refresh the tokens, sharing one in-flight refresh between all callers.
+
+        The refresh token rotates on every refresh, so two overlapping refreshes
+        would invalidate each other; always go through here rather than calling
+        refresh_access_token() directly.
+        """
+        task = self._refresh_task
+        if task is None or task.done():
+            task = self._refresh_task = self.hass.async_create_task(
+                self.refresh_access_token(), "kumo_cloud token refresh"
+            )
+        await asyncio.shield(task)
 
     async def _request(
         self, method: str, endpoint: str, data: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Make an authenticated request to the API with rate limiting."""
-        # Optimization 8: Use rate limiter context manager
-        async with self._rate_limiter:
-            await self._ensure_token_valid()
-
-            url = f"{self.base_url}/{API_VERSION}{endpoint}"
-            headers = {
-                "x-app-version": API_APP_VERSION,
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json",
-            }
-
-            max_retries = 3
-            retry_delay = 60  # Start with 60 seconds for 429 errors
-
-            for attempt in range(max_retries):
-                got_429 = False
-                try:
-                    # Use a longer timeout to account for network delays (30 seconds)
-                    # Note: 429 retry sleeps happen outside this timeout context
-                    async with asyncio.timeout(30):
-                        if method.upper() == "GET":
-                            async with self.session.get(url, headers=headers) as response:
-                                if response.status == 429:
-                                    got_429 = True
-                                    # Will handle sleep outside timeout context
-                                else:
-                                    response.raise_for_status()
-                                    result = await response.json()
-                                    return result
-                        elif method.upper() == "POST":
-                            async with self.session.post(
-                                url, headers=headers, json=data
-                            ) as response:
-                                if response.status == 429:
-                                    got_429 = True
-                                    # Will handle sleep outside timeout context
-                                else:
-                                    response.raise_for_status()
-                                    result = (
-                                        await response.json()
-                                        if response.content_type == "application/json"
-                                        else {}
-                                    )
-                                    return result
-
-                    # Handle 429 outside timeout context to avoid timeout during sleep
-                    if got_429:
-                        if attempt < max_retries - 1:
-                            _LOGGER.warning(
-                                "Rate limited (429). Waiting %d seconds before retry %d/%d",
-                                retry_delay,
-                                attempt + 1,
-                                max_retries,
-                            )
-                            try:
-                                await asyncio.sleep(retry_delay)
-                            except asyncio.CancelledError:
-                                raise
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        else:
-                            raise KumoCloudConnectionError(
-                                "Rate limit exceeded. Please try again later."
-                            )
-
-                except asyncio.TimeoutError as err:
-                    if attempt < max_retries - 1:
-                        _LOGGER.warning(
-                            "Request timeout. Retrying %d/%d", attempt + 1, max_retries
+        method = method.upper()
+        body = orjson.dumps(data) if method == "POST" and data is not None else None
+
+        # Check the token before taking a rate limiter slot so a refresh never
+        # holds up unrelated requests
+        await self._ensure_token_valid()
+
+        url = self._api_root + endpoint
+
+        max_retries = 3
+        retry_delay = 60  # Fallback backoff when the server sends no Retry-After
+
+        for attempt in range(max_retries):
+            retry_after: float | None = None
+            try:
+                # Optimization 8: Use rate limiter context manager. Every attempt,
+                # retries included, takes its own slot.
+                async with self._rate_limiter, self.session.request(
+                    method,
+                    url,
+                    headers=self._auth_headers,
+                    data=body,
+                    timeout=_REQUEST_TIMEOUT,
+                ) as response:
+                    if response.status == 429:
+                        retry_after = _parse_retry_after(
+                            response.headers.get("Retry-After")
                         )
-                        continue
-                    raise KumoCloudConnectionError("Request timeout") from err
-                except ClientResponseError as err:
-                    if err.status == 401:
-                        raise KumoCloudAuthError("Authentication failed") from err
-                    if err.status == 429:
-                        # This shouldn't happen as we handle it above, but just in case
-                        if attempt < max_retries - 1:
-                            _LOGGER.warning(
-                                "Rate limited (429). Waiting %d seconds before retry %d/%d",
-                                retry_delay,
-                                attempt + 1,
-                                max_retries,
-                            )
-                            try:
-                                await asyncio.sleep(retry_delay)
-                            except asyncio.CancelledError:
-                                raise
-                            retry_delay *= 2
-                            continue
+                    else:
+                        response.raise_for_status()
+                        if response.content_type == "application/json":
+                            return orjson.loads(await response.read())
+                        if method == "POST":
+                            # Commands may be acknowledged with an empty body
+                            return {}
+                        # A GET must return JSON; never let it pass as "no data"
                         raise KumoCloudConnectionError(
-                            "Rate limit exceeded. Please try again later."
-                        ) from err
-                    raise KumoCloudConnectionError(f"HTTP error: {err.status}") from err
+                            f"Unexpected content type: {response.content_type}"
+                        )
+
+                # Rate limited (429); the response has been released
+                if attempt < max_retries - 1:
+                    delay = retry_after if retry_after is not None else retry_delay
+                    _LOGGER.warning(
+                        "Rate limited (429). Waiting %d seconds before retry %d/%d",
+                        delay,
+                        attempt + 1,
+                        max_retries,
+                    )
+                    # Back off all traffic, not just this caller; the retry
+                    # waits for its next slot like everyone else
+                    self._rate_limiter.defer(delay)
+                    retry_delay *= 2  # Exponential backoff
+                    continue
+                raise KumoCloudConnectionError(
+                    "Rate limit exceeded. Please try again later."
+                )
+
+            except asyncio.TimeoutError as err:
+                if attempt < max_retries - 1:
+                    _LOGGER.warning(
+                        "Request timeout. Retrying %d/%d", attempt + 1, max_retries
+                    )
+                    continue
+                raise KumoCloudConnectionError("Request timeout") from err
+            except ClientResponseError as err:
+                if err.status == 401:
+                    raise KumoCloudAuthError("Authentication failed") from err
+                raise KumoCloudConnectionError(f"HTTP error: {err.status}") from err
 
     async def get_account_info(self) -> dict[str, Any]:
         """Get account information."""
-        return await self._request("GET", "/accounts/me")
+        return await self._request("GET", _ACCOUNTS_ME)
 
     async def get_sites(self) -> list[Site]:
         """Get list of sites."""
-        return await self._request("GET", "/sites/")
+        return await self._request("GET", _SITES)
 
     async def get_zones(self, site_id: str) -> list[Zone]:
         """Get list of zones for a site."""
@@ -333,12 +437,42 @@ class KumoCloudAPI:
         return await self._request("GET", f"/devices/{device_serial}")
 
     async def get_device_profile(self, device_serial: str) -> list[DeviceProfile]:
-        """Get device profile information."""
-        return await self._request("GET", f"/devices/{device_serial}/profile")
+        """Get device profile information, cached per device."""
+        task = self._profile_cache.get(device_serial)
+        if task is None:
+            task = self._profile_cache[device_serial] = self.hass.async_create_task(
+                self._request("GET", f"/devices/{device_serial}/profile"),
+                f"kumo_cloud profile fetch {device_serial}",
+            )
+
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            # Don't memoise failures; the next caller fetches again
+            if self._profile_cache.get(device_serial) is task:
+                del self._profile_cache[device_serial]
+            raise
+
+    def clear_profile_cache(self, device_serial: str | None = None) -> None:
+        """Drop cached device profiles for one device, or all devices."""
+        if device_serial is None:
+            self._profile_cache.clear()
+        else:
+            self._profile_cache.pop(device_serial, None)
+
+    def cancel_pending_tasks(self) -> None:
+        """Cancel in-flight token refresh and profile fetches (on unload)."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+        for task in self._profile_cache.values():
+            if not task.done():
+                task.cancel()
+        self._profile_cache.clear()
 
     async def send_command(
         self, device_serial: str, commands: dict[str, Any]
     ) -> dict[str, Any]:
         """Send command to device."""
         data = {"deviceSerial": device_serial, "commands": commands}
-        return await self._request("POST", "/devices/send-command", data)
+        return await self._request("POST", _SEND_COMMAND, data)
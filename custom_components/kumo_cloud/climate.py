@@ -18,7 +18,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import KumoCloudDataUpdateCoordinator, KumoCloudDevice
+from .coordinator import EMPTY_MAPPING, KumoCloudDataUpdateCoordinator, KumoCloudDevice
 from .const import (
     DOMAIN,
     OPERATION_MODE_OFF,
@@ -39,6 +39,7 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+
 # Mapping from Kumo Cloud operation modes to Home Assistant HVAC modes
 KUMO_TO_HVAC_MODE = {
     OPERATION_MODE_OFF: HVACMode.OFF,
@@ -139,7 +140,7 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
         """Handle updated data from the coordinator."""
         # Optimization 2: Clear optimistic values that match cloud state in one pass
         device_data = self.device.device_data
-        adapter = self.device.zone_data.get("adapter", {})
+        adapter = self.device.zone_data.get("adapter") or EMPTY_MAPPING
 
         # Rebuild optimistic state dict with only unmatched values
         self._optimistic_state = {
@@ -158,7 +159,7 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
 
         # Otherwise use cloud data
         device_data = self.device.device_data
-        adapter = self.device.zone_data.get("adapter", {})
+        adapter = self.device.zone_data.get("adapter") or EMPTY_MAPPING
         return device_data.get(key, adapter.get(key))
 
     @property
@@ -169,7 +170,7 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        adapter = self.device.zone_data.get("adapter", {})
+        adapter = self.device.zone_data.get("adapter") or EMPTY_MAPPING
         return adapter.get("roomTemp")
 
     @property
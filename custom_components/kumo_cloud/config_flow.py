@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -24,6 +25,20 @@ DATA_SCHEMA_USER = vol.Schema(
     }
 )
 
+DATA_SCHEMA_REAUTH = vol.Schema({vol.Required(CONF_PASSWORD): str})
+
+# Options validators and schema are built once; current values are filled in
+# per call as suggested values
+_OPTIONS_SCAN = vol.All(vol.Coerce(int), vol.Range(min=30, max=300))
+_OPTIONS_SETTLE = vol.All(vol.Coerce(float), vol.Range(min=0.5, max=5.0))
+
+_OPTIONS_SCHEMA_TEMPLATE = vol.Schema(
+    {
+        vol.Optional("scan_interval", default=DEFAULT_SCAN_INTERVAL): _OPTIONS_SCAN,
+        vol.Optional("command_settle_time", default=COMMAND_SETTLE_TIME): _OPTIONS_SETTLE,
+    }
+)
+
 
 async def validate_auth(
     hass: HomeAssistant, user_input: dict[str, Any]
@@ -37,16 +52,17 @@ async def validate_auth(
             user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
         )
 
-        # Get account info
-        account_info = await api.get_account_info()
-
-        # Get sites
-        sites = await api.get_sites()
+        # Account info and sites are independent once logged in; fetch both
+        # concurrently (CancelledError is a BaseException and propagates as-is)
+        account_info, sites = await asyncio.gather(
+            api.get_account_info(), api.get_sites()
+        )
 
         return {
             "login_result": login_result,
             "account_info": account_info,
             "sites": sites,
+            "sites_by_id": {site["id"]: site for site in sites},
             "api": api,
         }
     except KumoCloudAuthError:
@@ -122,8 +138,8 @@ class KumoCloudConfigFlow(ConfigFlow, domain=DOMAIN):
             return await self._create_entry()
 
         # Create site selection schema
-        sites = self.data["sites"]
-        site_options = {site["id"]: site["name"] for site in sites}
+        sites_by_id = self.data["sites_by_id"]
+        site_options = {site_id: site["name"] for site_id, site in sites_by_id.items()}
 
         data_schema = vol.Schema({vol.Required(CONF_SITE_ID): vol.In(site_options)})
 
@@ -131,16 +147,13 @@ class KumoCloudConfigFlow(ConfigFlow, domain=DOMAIN):
             step_id="site",
             data_schema=data_schema,
             errors=errors,
-            description_placeholders={"num_sites": str(len(sites))},
+            description_placeholders={"num_sites": str(len(sites_by_id))},
         )
 
     async def _create_entry(self) -> ConfigFlowResult:
         """Create the config entry."""
         # Optimization 14: Find the selected site with default to prevent StopIteration
-        selected_site = next(
-            (site for site in self.data["sites"] if site["id"] == self.data[CONF_SITE_ID]),
-            None
-        )
+        selected_site = self.data["sites_by_id"].get(self.data[CONF_SITE_ID])
 
         if selected_site is None:
             _LOGGER.error("Site %s not found in available sites", self.data[CONF_SITE_ID])
@@ -161,6 +174,7 @@ class KumoCloudConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_SITE_ID: self.data[CONF_SITE_ID],
                 "access_token": self.api.access_token,
                 "refresh_token": self.api.refresh_token,
+                "token_expires_at": self.api.token_expiry_timestamp(),
             },
         )
 
@@ -191,6 +205,7 @@ class KumoCloudConfigFlow(ConfigFlow, domain=DOMAIN):
                     **entry.data,
                     "access_token": info["api"].access_token,
                     "refresh_token": info["api"].refresh_token,
+                    "token_expires_at": info["api"].token_expiry_timestamp(),
                 }
                 updated_data.pop(CONF_PASSWORD, None)
                 self.hass.config_entries.async_update_entry(entry, data=updated_data)
@@ -207,7 +222,7 @@ class KumoCloudConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
+            data_schema=DATA_SCHEMA_REAUTH,
             errors=errors,
         )
 
@@ -225,14 +240,15 @@ class KumoCloudOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Optional(
-                    "scan_interval",
-                    default=self.config_entry.options.get("scan_interval", DEFAULT_SCAN_INTERVAL)
-                ): vol.All(vol.Coerce(int), vol.Range(min=30, max=300)),
-                vol.Optional(
-                    "command_settle_time",
-                    default=self.config_entry.options.get("command_settle_time", COMMAND_SETTLE_TIME)
-                ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=5.0)),
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                _OPTIONS_SCHEMA_TEMPLATE,
+                {
+                    "scan_interval": self.config_entry.options.get(
+                        "scan_interval", DEFAULT_SCAN_INTERVAL
+                    ),
+                    "command_settle_time": self.config_entry.options.get(
+                        "command_settle_time", COMMAND_SETTLE_TIME
+                    ),
+                },
+            ),
         )
@@ -14,6 +14,10 @@ API_APP_VERSION = "3.0.9"
 TOKEN_REFRESH_INTERVAL = 1200  # 20 minutes in seconds
 TOKEN_EXPIRY_MARGIN = 300  # 5 minutes margin in seconds
 
+# Rate limit (429) constants: bounds for honoring the Retry-After header
+RETRY_AFTER_MIN = 1  # seconds
+RETRY_AFTER_MAX = 300  # seconds
+
 # Device constants
 DEVICE_SERIAL = "deviceSerial"
 ZONE_ID = "zoneId"
@@ -101,3 +105,9 @@ DEFAULT_SCAN_INTERVAL = 60
 # Command settle time: wait period after sending command before refreshing device state
 # Optimization 17: Configurable settle time (default 1 second)
 COMMAND_SETTLE_TIME = 1.0  # seconds
+
+# Poll boost after a command: poll quickly, then back off geometrically
+# (2s, 4s, 8s, 16s) across the boost window before restoring the scan interval
+POLL_BOOST_INTERVAL = 2  # seconds
+POLL_BOOST_FACTOR = 2
+POLL_BOOST_WINDOW = 30  # seconds
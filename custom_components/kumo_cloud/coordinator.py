@@ -1,16 +1,47 @@
 from datetime import datetime, timedelta, timezone
+from collections.abc import Mapping
+from itertools import chain
+from types import MappingProxyType
 from typing import Any
 import asyncio
+import heapq
 import logging
 
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
 
 from .api import KumoCloudAPI, KumoCloudAuthError, KumoCloudConnectionError
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, COMMAND_SETTLE_TIME
+from .const import (
+    DOMAIN,
+    DEFAULT_SCAN_INTERVAL,
+    COMMAND_SETTLE_TIME,
+    POLL_BOOST_INTERVAL,
+    POLL_BOOST_FACTOR,
+    POLL_BOOST_WINDOW,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only default for missing nested dicts
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Adapter fields mirrored from a fresh device detail on a single-device refresh.
+# Listed explicitly: connectivity is owned by the zone poll, and new detail keys
+# must not start overwriting adapter fields implicitly.
+_ADAPTER_MIRROR_FIELDS = (
+    "roomTemp",
+    "operationMode",
+    "power",
+    "fanSpeed",
+    "airDirection",
+    "spCool",
+    "spHeat",
+    "humidity",
+)
+
+
 class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Kumo Cloud data."""
 
@@ -24,27 +55,37 @@ class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.api = api
         self.site_id = site_id
+        # Configured interval, restored once a post-command poll boost has run out
+        self._scan_interval = timedelta(seconds=scan_interval)
+        self._boost_schedule: list[timedelta] = []
         self.zones: list[dict[str, Any]] = []
         self.devices: dict[str, dict[str, Any]] = {}
         self.device_profiles: dict[str, list[dict[str, Any]]] = {}
         # Optimization 10: Zone index for O(1) lookups instead of O(n) linear search
         self.zone_index: dict[str, dict[str, Any]] = {}
+        # Zones keyed by adapter device serial, rebuilt once per poll
+        self.zones_by_serial: dict[str, dict[str, Any]] = {}
 
         # Instance variable to store cached commands
         # Optimization 3: Add max age to prevent memory leaks
-        self.cached_commands: dict[tuple[str, str], tuple[str, Any]] = {}
+        self.cached_commands: dict[tuple[str, str], tuple[datetime, Any]] = {}
         self._cache_max_age = timedelta(minutes=5)  # Clear commands older than 5 minutes
+        # Secondary index of cached command keys per device serial
+        self.cached_commands_by_device: dict[str, set[tuple[str, str]]] = {}
+        # Min-heap of (expiry, key) so stale cleanup only visits expired entries
+        self._cache_expiry: list[tuple[datetime, tuple[str, str]]] = []
 
     def _process_pending_commands(self, device_serial: str, device_detail: dict[str, Any]) -> None:
         """Process cached commands and cull outdated commands for a device."""
         # Check if the device already exists and the updatedAt matches
         if device_serial in self.devices and "updatedAt" in device_detail:
-            self.cull_cached_commands(device_serial, device_detail.get("updatedAt"))
+            self.cull_cached_commands(
+                device_serial, datetime.fromisoformat(device_detail["updatedAt"])
+            )
 
         # Reapply cached commands to the device details
-        for (cached_device_serial, command), (_, command_value) in self.cached_commands.items():
-            if cached_device_serial == device_serial:
-                device_detail[command] = command_value
+        for key in self.cached_commands_by_device.get(device_serial, ()):
+            device_detail[key[1]] = self.cached_commands[key][1]
 
     async def _async_update_data(self, _retry_attempted: bool = False) -> dict[str, Any]:
         """Fetch data from Kumo Cloud.
@@ -52,36 +93,36 @@ class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
         Args:
             _retry_attempted: Internal flag to prevent infinite recursion on token refresh
         """
+        if not _retry_attempted:
+            self._advance_poll_boost()
+
         try:
             # Get zones for the site
             zones = await self.api.get_zones(self.site_id)
 
             # Get device details for each zone
+            device_serials = [
+                zone["adapter"]["deviceSerial"] for zone in zones if zone.get("adapter")
+            ]
             devices = {}
             device_profiles = {}
 
             # Optimization 1: Fetch all zone data in parallel
-            tasks = []
-            device_serials = []
-
-            for zone in zones:
-                if "adapter" in zone and zone["adapter"]:
-                    device_serial = zone["adapter"]["deviceSerial"]
-                    device_serials.append(device_serial)
-
-                    # Create tasks for parallel execution
-                    tasks.append(self.api.get_device_details(device_serial))
-                    tasks.append(self.api.get_device_profile(device_serial))
-
-            # Execute all API calls in parallel
-            if tasks:
-                results = await asyncio.gather(*tasks)
+            if device_serials:
+                results = await asyncio.gather(
+                    *chain.from_iterable(
+                        (
+                            self.api.get_device_details(device_serial),
+                            self.api.get_device_profile(device_serial),
+                        )
+                        for device_serial in device_serials
+                    )
+                )
 
                 # Process results (alternating device_detail, device_profile)
-                for i, device_serial in enumerate(device_serials):
-                    device_detail = results[i * 2]
-                    device_profile = results[i * 2 + 1]
-
+                for device_serial, device_detail, device_profile in zip(
+                    device_serials, results[0::2], results[1::2]
+                ):
                     # Process pending commands for the device
                     self._process_pending_commands(device_serial, device_detail)
 
@@ -89,14 +130,29 @@ class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
                     device_profiles[device_serial] = device_profile
 
             # Store the data for access by entities
-            self.zones = zones
+            zone_index = self.zone_index
+            if zone_index.keys() == {zone["id"] for zone in zones}:
+                # Same zones as last poll: refresh the existing dicts in place so
+                # the index (and any references to its zones) stays valid
+                for zone in zones:
+                    existing = zone_index[zone["id"]]
+                    existing.clear()
+                    existing.update(zone)
+            else:
+                self.zones = zones
+                # Optimization 10: Build zone index for O(1) lookups
+                self.zone_index = {zone["id"]: zone for zone in zones}
             self.devices = devices
             self.device_profiles = device_profiles
-            # Optimization 10: Build zone index for O(1) lookups
-            self.zone_index = {zone["id"]: zone for zone in zones}
+            # Adapters can change under an unchanged zone, so always re-key by serial
+            self.zones_by_serial = {
+                zone["adapter"]["deviceSerial"]: zone
+                for zone in self.zones
+                if zone.get("adapter")
+            }
 
             return {
-                "zones": zones,
+                "zones": self.zones,
                 "devices": devices,
                 "device_profiles": device_profiles,
             }
@@ -106,16 +162,18 @@ class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
             if not _retry_attempted:
                 try:
                     _LOGGER.debug("Authentication failed, attempting token refresh")
-                    await self.api.refresh_access_token()
+                    await self.api.async_refresh_tokens()
                     # Retry the request with flag set to prevent further retries
                     return await self._async_update_data(_retry_attempted=True)
                 except KumoCloudAuthError as refresh_err:
-                    raise UpdateFailed(
+                    # The tokens can't be recovered; start reauth rather than
+                    # retrying setup (or polling) forever
+                    raise ConfigEntryAuthFailed(
                         f"Authentication failed after token refresh: {refresh_err}"
                     ) from refresh_err
             else:
                 # Already retried once, don't retry again to prevent infinite recursion
-                raise UpdateFailed(
+                raise ConfigEntryAuthFailed(
                     f"Authentication failed on retry: {err}"
                 ) from err
         except KumoCloudConnectionError as err:
@@ -123,6 +181,33 @@ class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    @callback
+    def async_boost_polling(self, device_serial: str) -> None:
+        """Poll quickly after a command, then ramp back to the scan interval."""
+        base = self._scan_interval.total_seconds()
+        schedule: list[timedelta] = []
+        interval = POLL_BOOST_INTERVAL
+        elapsed = 0
+        while interval < base and elapsed + interval <= POLL_BOOST_WINDOW:
+            schedule.append(timedelta(seconds=interval))
+            elapsed += interval
+            interval *= POLL_BOOST_FACTOR
+
+        if not schedule:
+            return
+
+        _LOGGER.debug("Boosting polling after command to device %s", device_serial)
+        self._boost_schedule = schedule[1:]
+        self.update_interval = schedule[0]
+        self._schedule_refresh()
+
+    def _advance_poll_boost(self) -> None:
+        """Step the poll boost schedule, restoring the scan interval when done."""
+        if self._boost_schedule:
+            self.update_interval = self._boost_schedule.pop(0)
+        elif self.update_interval != self._scan_interval:
+            self.update_interval = self._scan_interval
+
     async def async_refresh_device(self, device_serial: str) -> None:
         """Refresh a specific device's data immediately."""
         try:
@@ -135,35 +220,18 @@ class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
             # Update the cached device data
             self.devices[device_serial] = device_detail
 
-            # Also update the zone data if it contains the same info
-            for zone in self.zones:
-                if "adapter" in zone and zone["adapter"]:
-                    if zone["adapter"]["deviceSerial"] == device_serial:
-                        # Update adapter data with fresh device data
-                        zone["adapter"].update(
-                            {
-                                "roomTemp": device_detail.get("roomTemp"),
-                                "operationMode": device_detail.get("operationMode"),
-                                "power": device_detail.get("power"),
-                                "fanSpeed": device_detail.get("fanSpeed"),
-                                "airDirection": device_detail.get("airDirection"),
-                                "spCool": device_detail.get("spCool"),
-                                "spHeat": device_detail.get("spHeat"),
-                                "humidity": device_detail.get("humidity"),
-                            }
-                        )
-                        # Optimization 10: Update zone index as well
-                        self.zone_index[zone["id"]] = zone
-                        break
-
-            # Update the coordinator's data dict
-            self.data = {
-                "zones": self.zones,
-                "devices": self.devices,
-                "device_profiles": self.device_profiles,
-            }
-
-            # Notify all listeners that data has been updated
+            # Also update the zone data if it contains the same info. The zone
+            # is shared with zone_index, so updating it in place covers both.
+            zone = self.zones_by_serial.get(device_serial)
+            if zone is not None:
+                # Update adapter data with fresh device data
+                get = device_detail.get
+                zone["adapter"].update(
+                    {field: get(field) for field in _ADAPTER_MIRROR_FIELDS}
+                )
+
+            # self.data already references these containers, which were updated
+            # in place above; just notify all listeners
             self.async_update_listeners()
 
             _LOGGER.debug("Refreshed device %s data", device_serial)
@@ -171,32 +239,69 @@ class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.warning("Failed to refresh device %s: %s", device_serial, err)
 
-    def cache_command(self, device_serial: str, command: str, value: Any) -> None:
+    def cache_command(
+        self,
+        device_serial: str,
+        command: str,
+        value: Any,
+        now: datetime | None = None,
+    ) -> None:
         """Cache a command with its value and timestamp."""
-        current_time = datetime.now(timezone.utc).isoformat()
-        self.cached_commands[(device_serial, command)] = (current_time, value)
-        _LOGGER.debug("Cached command in device data: %s at %s", command, current_time)
+        if now is None:
+            now = datetime.now(timezone.utc)
+        self._cache_one(device_serial, command, value, now)
 
         # Optimization 3: Periodically clean up stale cached commands
-        self._cleanup_stale_cache()
+        self._cleanup_stale_cache(now)
 
-    def cull_cached_commands(self, device_serial: str, date: str) -> None:
-        """Remove cached commands for a device where the date is on or after the item's timestamp."""
-        to_remove = []
-        input_date = datetime.fromisoformat(date)
+    def cache_commands(
+        self,
+        device_serial: str,
+        commands: dict[str, Any],
+        now: datetime | None = None,
+    ) -> None:
+        """Cache several commands with one timestamp and a single cleanup pass."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        for command, value in commands.items():
+            self._cache_one(device_serial, command, value, now)
 
-        for key, value in self.cached_commands.items():
-            cached_device_serial, command = key
-            cached_date, _ = value
-            cached_date_obj = datetime.fromisoformat(cached_date)
+        self._cleanup_stale_cache(now)
 
-            # Check if the device_serial matches and the input date is on or after the cached date
-            if cached_device_serial == device_serial and input_date >= cached_date_obj:
-                to_remove.append(key)
+    def _cache_one(
+        self, device_serial: str, command: str, value: Any, now: datetime
+    ) -> None:
+        """Cache a single command without running stale-cache cleanup."""
+        self._set_cached_command((device_serial, command), (now, value))
+        _LOGGER.debug("Cached command in device data: %s at %s", command, now)
+
+    def _set_cached_command(self, key: tuple[str, str], value: tuple[datetime, Any]) -> None:
+        """Store a cached command and index it by device serial."""
+        self.cached_commands[key] = value
+        self.cached_commands_by_device.setdefault(key[0], set()).add(key)
+        heapq.heappush(self._cache_expiry, (value[0] + self._cache_max_age, key))
+
+    def _remove_cached_command(self, key: tuple[str, str]) -> None:
+        """Remove a cached command and drop it from the device index."""
+        del self.cached_commands[key]
+        device_keys = self.cached_commands_by_device.get(key[0])
+        if device_keys is not None:
+            device_keys.discard(key)
+            if not device_keys:
+                del self.cached_commands_by_device[key[0]]
+
+    def cull_cached_commands(self, device_serial: str, date: datetime) -> None:
+        """Remove cached commands for a device where the date is on or after the item's timestamp."""
+        # Only this device's entries are visited, via the per-device index
+        to_remove = [
+            key
+            for key in self.cached_commands_by_device.get(device_serial, ())
+            if date >= self.cached_commands[key][0]
+        ]
 
         # Remove the matching keys
         for key in to_remove:
-            del self.cached_commands[key]
+            self._remove_cached_command(key)
 
         # Optimization 5: Only log when commands are actually culled
         if to_remove:
@@ -206,27 +311,52 @@ class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
                 len(to_remove), device_serial, date, remaining_count
             )
 
-    def _cleanup_stale_cache(self) -> None:
+    def clear_cached_commands(self, device_serial: str | None = None) -> int:
+        """Drop cached commands for one device, or all devices; return how many."""
+        if device_serial is None:
+            count = len(self.cached_commands)
+            self.cached_commands.clear()
+            self.cached_commands_by_device.clear()
+            self._cache_expiry.clear()
+            return count
+
+        # Leftover heap entries for these keys are skipped lazily on cleanup
+        keys = list(self.cached_commands_by_device.get(device_serial, ()))
+        for key in keys:
+            self._remove_cached_command(key)
+        return len(keys)
+
+    def _cleanup_stale_cache(self, now: datetime | None = None) -> None:
         """Remove cached commands older than max age to prevent memory leaks."""
-        now = datetime.now(timezone.utc)
-        to_remove = []
+        if now is None:
+            now = datetime.now(timezone.utc)
+        heap = self._cache_expiry
+        removed = 0
 
-        for key, value in self.cached_commands.items():
-            cached_date_str, _ = value
-            cached_date = datetime.fromisoformat(cached_date_str)
+        while heap and heap[0][0] < now:
+            _, key = heapq.heappop(heap)
+            cached = self.cached_commands.get(key)
 
-            # Remove commands older than max age
-            if now - cached_date > self._cache_max_age:
-                to_remove.append(key)
+            # Heap entries are lazy: skip keys already culled or re-cached since
+            if cached is not None and now - cached[0] > self._cache_max_age:
+                self._remove_cached_command(key)
+                removed += 1
 
-        if to_remove:
-            for key in to_remove:
-                del self.cached_commands[key]
-            _LOGGER.debug("Cleaned up %d stale cached commands (older than %s)", len(to_remove), self._cache_max_age)
+        if removed:
+            _LOGGER.debug("Cleaned up %d stale cached commands (older than %s)", removed, self._cache_max_age)
 
 class KumoCloudDevice:
     """Representation of a Kumo Cloud device."""
 
+    __slots__ = (
+        "coordinator",
+        "zone_id",
+        "device_serial",
+        "_device_info",
+        "_unique_id",
+        "_name_fallback",
+    )
+
     def __init__(
         self,
         coordinator: KumoCloudDataUpdateCoordinator,
@@ -238,18 +368,23 @@ class KumoCloudDevice:
         self.zone_id = zone_id
         self.device_serial = device_serial
         # Optimization 13: Removed unused instance variables (_zone_data, _device_data, _profile_data)
+        # Device info is static once the model is known, so it is built once
+        self._device_info: DeviceInfo | None = None
+        # Static identifier strings, built once rather than on every access
+        self._unique_id = f"{device_serial}_{zone_id}"
+        self._name_fallback = f"Zone {zone_id}"
 
     @property
-    def zone_data(self) -> dict[str, Any]:
+    def zone_data(self) -> Mapping[str, Any]:
         """Get the zone data with O(1) lookup (Optimization 10)."""
         # Use zone index for constant-time lookup instead of O(n) linear search
-        return self.coordinator.zone_index.get(self.zone_id, {})
+        return self.coordinator.zone_index.get(self.zone_id, EMPTY_MAPPING)
 
     @property
-    def device_data(self) -> dict[str, Any]:
+    def device_data(self) -> Mapping[str, Any]:
         """Get the device data."""
         # Always get fresh data from coordinator
-        return self.coordinator.devices.get(self.device_serial, {})
+        return self.coordinator.devices.get(self.device_serial, EMPTY_MAPPING)
 
     @property
     def profile_data(self) -> list[dict[str, Any]]:
@@ -260,7 +395,7 @@ class KumoCloudDevice:
     @property
     def available(self) -> bool:
         """Return True if device is available."""
-        adapter = self.zone_data.get("adapter", {})
+        adapter = self.zone_data.get("adapter") or EMPTY_MAPPING
         device_data = self.device_data
 
         # Check both adapter and device data for connection status
@@ -272,34 +407,38 @@ class KumoCloudDevice:
     @property
     def name(self) -> str:
         """Return the name of the device."""
-        return self.zone_data.get("name", f"Zone {self.zone_id}")
+        return self.zone_data.get("name", self._name_fallback)
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID for the device."""
-        return f"{self.device_serial}_{self.zone_id}"
+        return self._unique_id
 
     @property
-    def device_info(self) -> "DeviceInfo":  # Optimization 27: Add type hint
+    def device_info(self) -> DeviceInfo:  # Optimization 27: Add type hint
         """Return device information shared across all entities (Optimization 12).
 
         This consolidates duplicate device_info implementations from climate and sensor entities.
         """
-        from homeassistant.helpers.device_registry import DeviceInfo
-        from .const import DOMAIN
+        if self._device_info is not None:
+            return self._device_info
 
         zone_data = self.zone_data
         device_data = self.device_data
-        model = device_data.get("model", {}).get("materialDescription", "Unknown Model")
+        model_dict = device_data.get("model") or EMPTY_MAPPING
 
-        return DeviceInfo(
+        device_info = DeviceInfo(
             identifiers={(DOMAIN, self.device_serial)},
             name=zone_data.get("name", "Kumo Cloud Device"),
             manufacturer="Mitsubishi Electric",
-            model=model,
-            sw_version=device_data.get("model", {}).get("serialProfile"),
+            model=model_dict.get("materialDescription", "Unknown Model"),
+            sw_version=model_dict.get("serialProfile"),
             serial_number=device_data.get("serialNumber"),
         )
+        # Only memoise once device details have arrived, so the model is real
+        if "model" in device_data:
+            self._device_info = device_info
+        return device_info
 
     async def send_command(self, commands: dict[str, Any]) -> None:
         """Send a command to the device and refresh status."""
@@ -310,6 +449,9 @@ class KumoCloudDevice:
             # Cache the commands in the coordinator immediately
             self.cache_commands(commands)
 
+            # Poll more often while the device catches up with the command
+            self.coordinator.async_boost_polling(self.device_serial)
+
             # Optimization 17: Wait for command to be processed (configurable)
             await asyncio.sleep(COMMAND_SETTLE_TIME)
 
@@ -322,14 +464,17 @@ class KumoCloudDevice:
             )
             raise
 
-    def cache_command(self, command: str, value: Any) -> None:
+    def cache_command(
+        self, command: str, value: Any, now: datetime | None = None
+    ) -> None:
         """Cache a command with its value and timestamp in the coordinator."""
-        self.coordinator.cache_command(self.device_serial, command, value)
+        self.coordinator.cache_command(self.device_serial, command, value, now)
 
-    def cache_commands(self, commands: dict[str, Any]) -> None:
+    def cache_commands(
+        self, commands: dict[str, Any], now: datetime | None = None
+    ) -> None:
         """Cache multiple commands with their values and timestamps in the coordinator."""
-        for command, value in commands.items():
-            self.cache_command(command, value)
+        self.coordinator.cache_commands(self.device_serial, commands, now)
 
     def async_shutdown(self) -> None:
         """Shutdown coordinator and clean up resources (Optimization 34)."""
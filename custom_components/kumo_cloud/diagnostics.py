@@ -9,15 +9,17 @@ from homeassistant.core import HomeAssistant
 
 from .const import CONF_SITE_ID, DOMAIN
 
-TO_REDACT = {
-    "access_token",
-    "refresh_token",
-    "username",
-    "password",
-    "serialNumber",
-    "deviceSerial",
-    "email",
-}
+TO_REDACT = frozenset(
+    {
+        "access_token",
+        "refresh_token",
+        "username",
+        "password",
+        "serialNumber",
+        "deviceSerial",
+        "email",
+    }
+)
 
 
 async def async_get_config_entry_diagnostics(
@@ -9,16 +9,16 @@ from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, Sen
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature  # Optimization 18: Removed unused ATTR_TEMPERATURE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import KumoCloudDataUpdateCoordinator, KumoCloudDevice
+from .coordinator import EMPTY_MAPPING, KumoCloudDataUpdateCoordinator, KumoCloudDevice
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -27,17 +27,20 @@ async def async_setup_entry(
     """Set up Kumo Cloud sensor devices."""
     coordinator: KumoCloudDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for zone in coordinator.zones:
-        if "adapter" in zone and zone["adapter"]:
-            device_serial = zone["adapter"]["deviceSerial"]
-            zone_id = zone["id"]
-
-            device = KumoCloudDevice(coordinator, zone_id, device_serial)
-            entities.append(KumoCloudTemperatureSensor(device))
-            entities.append(KumoCloudHumiditySensor(device))
+    # One shared KumoCloudDevice per zone backs both sensor types
+    devices = [
+        KumoCloudDevice(coordinator, zone["id"], zone["adapter"]["deviceSerial"])
+        for zone in coordinator.zones
+        if zone.get("adapter")
+    ]
 
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            sensor_cls(device)
+            for device in devices
+            for sensor_cls in (KumoCloudTemperatureSensor, KumoCloudHumiditySensor)
+        ]
+    )
 
 
 class KumoCloudTemperatureSensor(CoordinatorEntity, SensorEntity):
@@ -52,6 +55,8 @@ class KumoCloudTemperatureSensor(CoordinatorEntity, SensorEntity):
         """Initialize the temperature sensor."""
         super().__init__(device.coordinator)
         self.device = device
+        # Optimization 12: device info is shared with (and cached by) the device
+        self._attr_device_info = device.device_info
         self._attr_unique_id = f"{device.device_serial}_temperature"
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = SensorDeviceClass.TEMPERATURE  # Optimization 19: Use enum
@@ -60,7 +65,7 @@ class KumoCloudTemperatureSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> float | None:
         """Return the current temperature."""
-        adapter = self.device.zone_data.get("adapter", {})
+        adapter = self.device.zone_data.get("adapter") or EMPTY_MAPPING
         return adapter.get("roomTemp")
 
     @property
@@ -68,11 +73,6 @@ class KumoCloudTemperatureSensor(CoordinatorEntity, SensorEntity):
         """Return True if entity is available (Optimization 11)."""
         return self.device.available and self.coordinator.last_update_success
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information (Optimization 12: delegated to device)."""
-        return self.device.device_info
-
 
 class KumoCloudHumiditySensor(CoordinatorEntity, SensorEntity):
     """Representation of a Kumo Cloud humidity sensor."""
@@ -86,6 +86,8 @@ class KumoCloudHumiditySensor(CoordinatorEntity, SensorEntity):
         """Initialize the humidity sensor."""
         super().__init__(device.coordinator)
         self.device = device
+        # Optimization 12: device info is shared with (and cached by) the device
+        self._attr_device_info = device.device_info
         self._attr_unique_id = f"{device.device_serial}_humidity"
         self._attr_native_unit_of_measurement = "%"
         self._attr_device_class = SensorDeviceClass.HUMIDITY  # Optimization 19: Use enum
@@ -94,7 +96,7 @@ class KumoCloudHumiditySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int | None:
         """Return the current humidity."""
-        adapter = self.device.zone_data.get("adapter", {})
+        adapter = self.device.zone_data.get("adapter") or EMPTY_MAPPING
         device_data = self.device.device_data
         return device_data.get("humidity", adapter.get("humidity"))
 
@@ -102,8 +104,3 @@ class KumoCloudHumiditySensor(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return True if entity is available (Optimization 11)."""
         return self.device.available and self.coordinator.last_update_success
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information (Optimization 12: delegated to device)."""
-        return self.device.device_info
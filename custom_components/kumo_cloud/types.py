@@ -1,15 +1,17 @@
 """Type definitions for Kumo Cloud integration (Optimization 7)."""
 
-from __future__ import annotations
-
 from typing import TypedDict, NotRequired
 
 
-class DeviceModel(TypedDict):
-    """Device model information."""
-
-    materialDescription: NotRequired[str]
-    serialProfile: NotRequired[str]
+# Device model information
+DeviceModel = TypedDict(
+    "DeviceModel",
+    {
+        "materialDescription": str,
+        "serialProfile": str,
+    },
+    total=False,
+)
 
 
 class DeviceAdapter(TypedDict):
@@ -35,48 +37,56 @@ class Zone(TypedDict):
     adapter: NotRequired[DeviceAdapter]
 
 
-class DeviceDetail(TypedDict):
-    """Device detail information."""
-
-    serialNumber: NotRequired[str]
-    model: NotRequired[DeviceModel]
-    roomTemp: NotRequired[float]
-    operationMode: NotRequired[str]
-    power: NotRequired[int]
-    fanSpeed: NotRequired[str]
-    airDirection: NotRequired[str]
-    spCool: NotRequired[float]
-    spHeat: NotRequired[float]
-    humidity: NotRequired[int]
-    connected: NotRequired[bool]
-    updatedAt: NotRequired[str]
-
-
-class MinimumSetPoints(TypedDict):
-    """Minimum temperature setpoints."""
-
-    heat: NotRequired[float]
-    cool: NotRequired[float]
-
-
-class MaximumSetPoints(TypedDict):
-    """Maximum temperature setpoints."""
-
-    heat: NotRequired[float]
-    cool: NotRequired[float]
-
-
-class DeviceProfile(TypedDict):
-    """Device profile capabilities."""
-
-    numberOfFanSpeeds: NotRequired[int]
-    hasVaneSwing: NotRequired[bool]
-    hasVaneDir: NotRequired[bool]
-    hasModeHeat: NotRequired[bool]
-    hasModeDry: NotRequired[bool]
-    hasModeVent: NotRequired[bool]
-    minimumSetPoints: NotRequired[MinimumSetPoints]
-    maximumSetPoints: NotRequired[MaximumSetPoints]
+# Device detail information
+DeviceDetail = TypedDict(
+    "DeviceDetail",
+    {
+        "serialNumber": str,
+        "model": DeviceModel,
+        "roomTemp": float,
+        "operationMode": str,
+        "power": int,
+        "fanSpeed": str,
+        "airDirection": str,
+        "spCool": float,
+        "spHeat": float,
+        "humidity": int,
+        "connected": bool,
+        "updatedAt": str,
+    },
+    total=False,
+)
+
+
+# Minimum temperature setpoints
+MinimumSetPoints = TypedDict(
+    "MinimumSetPoints",
+    {"heat": float, "cool": float},
+    total=False,
+)
+
+# Maximum temperature setpoints
+MaximumSetPoints = TypedDict(
+    "MaximumSetPoints",
+    {"heat": float, "cool": float},
+    total=False,
+)
+
+# Device profile capabilities
+DeviceProfile = TypedDict(
+    "DeviceProfile",
+    {
+        "numberOfFanSpeeds": int,
+        "hasVaneSwing": bool,
+        "hasVaneDir": bool,
+        "hasModeHeat": bool,
+        "hasModeDry": bool,
+        "hasModeVent": bool,
+        "minimumSetPoints": MinimumSetPoints,
+        "maximumSetPoints": MaximumSetPoints,
+    },
+    total=False,
+)
 
 
 class TokenResponse(TypedDict):
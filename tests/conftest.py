@@ -1,45 +1,83 @@
 """Common fixtures for Kumo Cloud tests (Optimization 30)."""
+from copy import deepcopy
+
 import pytest
 from unittest.mock import MagicMock, patch
 
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 
+from custom_components.kumo_cloud.api import KumoCloudAPI
 from custom_components.kumo_cloud.const import CONF_SITE_ID, DOMAIN
 
+# Canned API payloads, built once. The integration updates payloads in place,
+# so each test is handed its own deep copy (see _pin_api_returns).
+LOGIN_RESPONSE = {"token": {"access": "test_token", "refresh": "test_refresh"}}
 
-@pytest.fixture
+SITES = [
+    {"id": "site_1", "name": "Test Site"}
+]
+
+ZONES = [
+    {
+        "id": "zone_1",
+        "name": "Test Zone",
+        "adapter": {"deviceSerial": "device_1"}
+    }
+]
+
+DEVICE_DETAILS = {
+    "serialNumber": "device_1",
+    "model": {"materialDescription": "Test Model"},
+    "roomTemp": 22.5,
+    "operationMode": "cool",
+    "power": 1,
+}
+
+DEVICE_PROFILE = [
+    {
+        "numberOfFanSpeeds": 5,
+        "hasVaneSwing": True,
+        "hasModeHeat": True,
+    }
+]
+
+
+def _pin_api_returns(api_instance: MagicMock) -> None:
+    """Point the mocked API client at fresh copies of the canned payloads."""
+    api_instance.access_token = "test_token"
+    api_instance.refresh_token = "test_refresh"
+    api_instance.login.return_value = deepcopy(LOGIN_RESPONSE)
+    api_instance.get_sites.return_value = deepcopy(SITES)
+    api_instance.get_zones.return_value = deepcopy(ZONES)
+    api_instance.get_device_details.return_value = deepcopy(DEVICE_DETAILS)
+    api_instance.get_device_profile.return_value = deepcopy(DEVICE_PROFILE)
+
+
+@pytest.fixture(scope="session")
 def mock_kumo_api():
-    """Mock Kumo Cloud API client."""
-    with patch("custom_components.kumo_cloud.api.KumoCloudAPI") as mock:
-        api_instance = mock.return_value
-        api_instance.access_token = "test_token"
-        api_instance.refresh_token = "test_refresh"
-        api_instance.login.return_value = {"token": {"access": "test_token", "refresh": "test_refresh"}}
-        api_instance.get_sites.return_value = [
-            {"id": "site_1", "name": "Test Site"}
-        ]
-        api_instance.get_zones.return_value = [
-            {
-                "id": "zone_1",
-                "name": "Test Zone",
-                "adapter": {"deviceSerial": "device_1"}
-            }
-        ]
-        api_instance.get_device_details.return_value = {
-            "serialNumber": "device_1",
-            "model": {"materialDescription": "Test Model"},
-            "roomTemp": 22.5,
-            "operationMode": "cool",
-            "power": 1,
-        }
-        api_instance.get_device_profile.return_value = [
-            {
-                "numberOfFanSpeeds": 5,
-                "hasVaneSwing": True,
-                "hasModeHeat": True,
-            }
-        ]
-        yield api_instance
+    """Mock Kumo Cloud API client, built once for the whole session.
+
+    Specced against the real client so its coroutine methods are AsyncMocks
+    and its plain methods (e.g. cancel_pending_tasks) stay MagicMocks.
+    """
+    api_instance = MagicMock(spec=KumoCloudAPI)
+    _pin_api_returns(api_instance)
+    return api_instance
+
+
+@pytest.fixture
+def reset_api(mock_kumo_api):
+    """Give a test a clean call history and the canned return values."""
+    mock_kumo_api.reset_mock(return_value=False, side_effect=True)
+    _pin_api_returns(mock_kumo_api)
+    return mock_kumo_api
+
+
+@pytest.fixture
+def patched_api(mock_kumo_api):
+    """Make the integration's setup construct the mocked API client."""
+    with patch("custom_components.kumo_cloud.KumoCloudAPI", return_value=mock_kumo_api):
+        yield mock_kumo_api
 
 
 @pytest.fixture
@@ -0,0 +1,91 @@
+"""Test Kumo Cloud API helpers."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.kumo_cloud.api import KumoCloudAPI, TokenBucket, _parse_retry_after
+from custom_components.kumo_cloud.const import RETRY_AFTER_MAX, RETRY_AFTER_MIN
+
+
+@pytest.mark.parametrize("value", [None, "", "soon"])
+def test_parse_retry_after_invalid(value):
+    """Test missing or unparsable Retry-After headers."""
+    assert _parse_retry_after(value) is None
+
+
+def test_parse_retry_after_seconds():
+    """Test delta-seconds Retry-After headers."""
+    assert _parse_retry_after("42") == 42
+
+
+def test_parse_retry_after_http_date():
+    """Test HTTP-date Retry-After headers."""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+    delay = _parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert 115 <= delay <= 120
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("0", RETRY_AFTER_MIN),
+        (str(RETRY_AFTER_MAX * 10), RETRY_AFTER_MAX),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", RETRY_AFTER_MIN),
+    ],
+)
+def test_parse_retry_after_clamped(value, expected):
+    """Test Retry-After delays are clamped to the configured bounds."""
+    assert _parse_retry_after(value) == expected
+
+
+async def test_token_bucket_defer_holds_queued_callers():
+    """Test a 429 backoff also delays requests that already reserved a slot."""
+    bucket = TokenBucket(timedelta(seconds=0.05))
+    loop = asyncio.get_running_loop()
+    starts = []
+
+    async def request():
+        async with bucket:
+            starts.append(loop.time())
+
+    start = loop.time()
+    async with bucket:
+        pass
+
+    # Queue several callers behind the first request, then back off
+    tasks = [asyncio.create_task(request()) for _ in range(4)]
+    await asyncio.sleep(0)
+    bucket.defer(0.3)
+    await asyncio.gather(*tasks)
+
+    assert all(begin - start >= 0.3 for begin in starts)
+    starts.sort()
+    assert all(b - a >= 0.045 for a, b in zip(starts, starts[1:]))
+
+
+async def test_token_refresh_is_single_flight(hass: HomeAssistant):
+    """Test overlapping refreshes (proactive and after a 401) share one request."""
+    api = KumoCloudAPI(hass)
+    release = asyncio.Event()
+
+    async def refresh():
+        await release.wait()
+
+    with patch.object(
+        KumoCloudAPI, "refresh_access_token", side_effect=refresh
+    ) as mock_refresh:
+        first = hass.async_create_task(api.async_refresh_tokens())
+        second = hass.async_create_task(api.async_refresh_tokens())
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, second)
+        assert mock_refresh.await_count == 1
+
+        # Once finished, the next refresh starts a new request
+        await api.async_refresh_tokens()
+        assert mock_refresh.await_count == 2
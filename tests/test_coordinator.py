@@ -0,0 +1,65 @@
+"""Test the Kumo Cloud data update coordinator."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.kumo_cloud.coordinator import KumoCloudDataUpdateCoordinator
+
+
+def _coordinator(hass: HomeAssistant, scan_interval: int = 60) -> KumoCloudDataUpdateCoordinator:
+    """Create a coordinator backed by a mocked API client."""
+    return KumoCloudDataUpdateCoordinator(hass, MagicMock(), "site_1", scan_interval)
+
+
+async def test_poll_boost_schedule(hass: HomeAssistant):
+    """Test polling speeds up after a command, then restores the scan interval."""
+    coordinator = _coordinator(hass)
+
+    with patch.object(coordinator, "_schedule_refresh") as schedule_refresh:
+        coordinator.async_boost_polling("device_1")
+
+    schedule_refresh.assert_called_once()
+    intervals = [coordinator.update_interval]
+    for _ in range(3):
+        coordinator._advance_poll_boost()
+        intervals.append(coordinator.update_interval)
+    assert intervals == [timedelta(seconds=s) for s in (2, 4, 8, 16)]
+
+    coordinator._advance_poll_boost()
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+
+async def test_poll_boost_skipped_for_fast_scan_interval(hass: HomeAssistant):
+    """Test no boost is scheduled when polling is already at least that fast."""
+    coordinator = _coordinator(hass, scan_interval=2)
+
+    with patch.object(coordinator, "_schedule_refresh") as schedule_refresh:
+        coordinator.async_boost_polling("device_1")
+
+    schedule_refresh.assert_not_called()
+    assert coordinator.update_interval == timedelta(seconds=2)
+
+
+async def test_stale_cache_expiry(hass: HomeAssistant):
+    """Test stale cached commands expire, but re-cached ones survive their old entry."""
+    coordinator = _coordinator(hass)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    coordinator.cache_command("device_1", "spCool", 22, now=start)
+    coordinator.cache_command("device_2", "power", 1, now=start)
+    # Re-cache one key; its original heap entry is now stale
+    coordinator.cache_command("device_1", "spCool", 23, now=start + timedelta(minutes=4))
+
+    coordinator._cleanup_stale_cache(start + timedelta(minutes=5, seconds=1))
+    assert coordinator.cached_commands == {
+        ("device_1", "spCool"): (start + timedelta(minutes=4), 23),
+    }
+    assert coordinator.cached_commands_by_device == {
+        "device_1": {("device_1", "spCool")},
+    }
+
+    coordinator._cleanup_stale_cache(start + timedelta(minutes=9, seconds=1))
+    assert coordinator.cached_commands == {}
+    assert coordinator.cached_commands_by_device == {}
+    assert coordinator._cache_expiry == []